@@ -19,9 +19,11 @@ Features:
 - Dark mode support
 """
 
+import importlib.util
 import re
 import sys
-from typing import Union, Callable, Dict, Tuple, List
+from functools import lru_cache
+from typing import Any, Optional, Union, Callable, Dict, Tuple, List
 
 # Try to import colorama for Windows color support
 try:
@@ -31,6 +33,10 @@ try:
 except ImportError:
     HAS_COLORAMA = False
 
+# numba (with numpy) JIT-compiles a digit kernel for large non-steps conversions;
+# both are heavy, so they are only imported on first use (see _get_numba_encoder)
+HAS_NUMBA = importlib.util.find_spec("numba") is not None
+
 # ------------------------------------------------------------------
 # Constants
 # ------------------------------------------------------------------
@@ -44,6 +50,14 @@ BASE_DIGITS = "0123456789ABCDEF"
 MAX_BASE = 16
 MIN_BASE = 2
 
+# Digit character -> value, accepting either letter case
+DIGIT_VALUES = {digit: value for value, digit in enumerate(BASE_DIGITS)}
+DIGIT_VALUES.update({digit.lower(): value for value, digit in enumerate(BASE_DIGITS)})
+
+# ASCII digit bytes and whole bits per digit (floor of log2(base)) for sizing buffers
+BASE_DIGIT_BYTES = BASE_DIGITS.encode("ascii")
+BASE_BITS = {base: base.bit_length() - 1 for base in range(MIN_BASE, MAX_BASE + 1)}
+
 # Color schemes
 COLOR_SCHEMES = {
     'light': {
@@ -77,25 +91,217 @@ CURRENT_SCHEME = 'dark'
 
 # ANSI Color Codes
 class Colors:
+    # Codes bound per instance from COLOR_SCHEMES in __init__
+    RESET: str
+    RED: str
+    GREEN: str
+    YELLOW: str
+    BLUE: str
+    PURPLE: str
+    CYAN: str
+    WHITE: str
+    BOLD: str
+    UNDERLINE: str
+    
     def __init__(self, scheme='dark'):
         self.scheme = scheme
         self.colors = COLOR_SCHEMES.get(scheme, COLOR_SCHEMES['dark'])
-        
-    def __getattr__(self, name):
-        return self.colors.get(name, "")
+        # Bind each code as a plain attribute so lookups never reach Python code
+        for name, code in self.colors.items():
+            setattr(self, name, code)
+        # Bold + color combinations for headers, menu options, results and errors
+        self.HEADER = self.BOLD + self.CYAN
+        self.OPTION = self.BOLD + self.YELLOW
+        self.SUCCESS = self.BOLD + self.GREEN
+        self.ERROR = self.BOLD + self.RED
 
 # Create global Colors instance
 colors = Colors(CURRENT_SCHEME)
 
+# Rendered menu for the current color scheme; reset by toggle_color_scheme
+_menu_cache: Optional[str] = None
+
 # Maximum bits for two's complement representation
 MAX_BITS = 64
 
+# format() specs for the bases CPython can render natively
+FORMAT_SPECS = {2: "b", 8: "o", 16: "X"}
+
+# Precompiled digit patterns (sign already stripped, letters uppercased)
+BIN_RE = re.compile(r"[01]+")
+OCT_RE = re.compile(r"[0-7]+")
+HEX_RE = re.compile(r"[0-9A-F]+")
+BASE_RES = {base: re.compile(f"[{BASE_DIGITS[:base]}]+") for base in range(MIN_BASE, MAX_BASE + 1)}
+
+# str.translate tables expanding each octal/hex digit to its bits
+OCT_TO_BIN = str.maketrans({str(value): f"{value:03b}" for value in range(8)})
+HEX_TO_BIN = str.maketrans({digit: f"{value:04b}" for value, digit in enumerate(HEX_DIGITS)})
+
+# Base detection: prefixes, and the tightest base each digit character allows
+PREFIX_BASES = {"0b": 2, "0o": 8, "0x": 16}
+CATEGORY_BASES = (2, 8, 10, 16)
+DIGIT_CATEGORIES = {
+    digit: category
+    for category, digits in enumerate(("01", "234567", "89", "ABCDEFabcdef"))
+    for digit in digits
+}
+
+# Characters accepted by the interactive readers (besides a leading '-')
+BIN_CHARS = frozenset("01")
+OCT_CHARS = frozenset("01234567")
+HEX_CHARS = frozenset("0123456789ABCDEFabcdef")
+
+# Entries kept by each memoized (non-steps) conversion
+CACHE_SIZE = 4096
+
+# Rule separating sections of the step-by-step and result output
+SEPARATOR = "=" * 50
+
+# Step-line classifiers for coloring in the menu, checked in this order
+STEP_LABEL_RE = re.compile(r"Step|Position|Digit|Value")
+STEP_RESULT_RE = re.compile(r"final|result", re.IGNORECASE)
+STEP_RULE_RE = re.compile(r"[-|]")
+
+# Step-table headers (column titles and separator) for show_steps output
+DEC_TO_BASE_HEADER = (
+    "Step | Decimal | Divided by Base | Remainder | Digit",
+    "---- | ------- | --------------- | --------- | -----",
+)
+BASE_TO_DEC_HEADERS = {
+    base: (
+        f"Position | Digit | Digit Value | Value = Digit Value × {base}^Position",
+        "-------- | ----- | ----------- | -----------------------------------------",
+    )
+    for base in range(MIN_BASE, MAX_BASE + 1)
+}
+FLOAT_FRACTION_HEADER = (
+    "Step | Fractional | Multiplied by Base | Result    | Integer Part",
+    "---- | ---------- | ------------------ | --------- | ------------",
+)
+DEC_TO_BIN_HEADER = (
+    "Step | Decimal | Divided by 2 | Remainder",
+    "---- | ------- | ------------ | ---------",
+)
+DEC_TO_OCT_HEADER = (
+    "Step | Decimal | Divided by 8 | Remainder",
+    "---- | ------- | ------------ | ---------",
+)
+DEC_TO_HEX_HEADER = (
+    "Step | Decimal | Divided by 16 | Remainder | Hex Digit",
+    "---- | ------- | ------------ | --------- | ---------",
+)
+BIN_TO_DEC_HEADER = (
+    "Position | Digit | Value = Digit × 2^Position",
+    "-------- | ----- | --------------------------",
+)
+OCT_TO_DEC_HEADER = (
+    "Position | Digit | Value = Digit × 8^Position",
+    "-------- | ----- | --------------------------",
+)
+HEX_TO_DEC_HEADER = (
+    "Position | Digit | Digit Value | Value = Digit Value × 16^Position",
+    "-------- | ----- | ----------- | -----------------------------------",
+)
+
+# Values at least this wide (and at most 63 bits) go through the numba kernel;
+# below it the pure-Python encoders beat the kernel's call overhead
+NUMBA_MIN_BITS = 24
+
+# numpy array of the digit characters; set by _get_numba_encoder before compiling
+DIGIT_CODES: Any = None
+
+
+def _u64_to_base(n, base, out):
+    """Write the digits of n into the tail of out and return the start index."""
+    i = out.shape[0]
+    while n:
+        i -= 1
+        out[i] = DIGIT_CODES[n % base]
+        n //= base
+    return i
+
+
+# Encoder around the compiled _u64_to_base; built on first use, not at import
+_numba_encoder: Optional[Callable[[int, int], str]] = None
+
+
+def _get_numba_encoder() -> Optional[Callable[[int, int], str]]:
+    """
+    Import numba and numpy and compile _u64_to_base the first time it is needed.
+    
+    Returns:
+        A function rendering an int of at most 63 bits in a base, or None if numba cannot be imported
+    """
+    global HAS_NUMBA, DIGIT_CODES, _numba_encoder
+    
+    if _numba_encoder is None:
+        try:
+            from numba import njit
+            import numpy as np
+        except ImportError:
+            HAS_NUMBA = False
+            return None
+        
+        # Read by _u64_to_base as a global, so it must exist before compiling
+        DIGIT_CODES = np.frombuffer(BASE_DIGITS.encode("ascii"), dtype=np.uint8)
+        kernel = njit("intp(int64, int64, uint8[::1])", cache=True)(_u64_to_base)
+        
+        def encode(n: int, base: int) -> str:
+            out = np.empty(64, dtype=np.uint8)
+            start = kernel(n, base, out)
+            return out[start:].tobytes().decode("ascii")
+        
+        _numba_encoder = encode
+    return _numba_encoder
+
 # ------------------------------------------------------------------
 # 1. Low-level converters (manual algorithms)
 # ------------------------------------------------------------------
 
 # ---------- General base conversion functions
 
+def _dec_to_base_divmod(n: int, base: int) -> str:
+    """Render a positive integer in the given base by repeated division."""
+    # Fill a preallocated buffer from the right; no list growth or reversal
+    out = bytearray(n.bit_length() // BASE_BITS[base] + 1)
+    i = len(out)
+    while n:
+        i -= 1
+        n, remainder = divmod(n, base)
+        out[i] = BASE_DIGIT_BYTES[remainder]
+    return out[i:].decode("ascii")
+
+
+def _dec_to_base_shift(n: int, base: int) -> str:
+    """Render a positive integer in a power-of-two base by masking and shifting."""
+    shift = BASE_BITS[base]
+    mask = base - 1
+    out = bytearray(n.bit_length() // shift + 1)
+    i = len(out)
+    while n:
+        i -= 1
+        out[i] = BASE_DIGIT_BYTES[n & mask]
+        n >>= shift
+    return out[i:].decode("ascii")
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _dec_to_base_digits(n: int, base: int) -> str:
+    """Render a non-negative integer in the given base without recording steps."""
+    spec = FORMAT_SPECS.get(base)
+    if spec is not None:
+        return format(n, spec)
+    
+    if HAS_NUMBA and NUMBA_MIN_BITS <= n.bit_length() <= 63:
+        encode = _get_numba_encoder()
+        if encode is not None:
+            return encode(n, base)
+    
+    if base & (base - 1) == 0:
+        return _dec_to_base_shift(n, base)
+    return _dec_to_base_divmod(n, base)
+
+
 def dec_to_base(n: int, base: int, show_steps: bool = False) -> Union[str, Tuple[str, List[str]]]:
     """
     Convert a decimal integer to any base representation (2-16).
@@ -121,6 +327,10 @@ def dec_to_base(n: int, base: int, show_steps: bool = False) -> Union[str, Tuple
     if not MIN_BASE <= base <= MAX_BASE:
         raise ValueError(f"Base must be between {MIN_BASE} and {MAX_BASE}")
     
+    if not show_steps:
+        result = _dec_to_base_digits(abs(n), base)
+        return f"-{result}" if n < 0 else result
+    
     is_negative = n < 0
     if is_negative:
         steps.append(f"Converting negative number: {original_n}")
@@ -130,32 +340,51 @@ def dec_to_base(n: int, base: int, show_steps: bool = False) -> Union[str, Tuple
     digits = []
     working_n = n
     
-    if show_steps:
-        steps.append(f"Starting decimal to base {base} conversion of {working_n}:")
-        steps.append("Step | Decimal | Divided by Base | Remainder | Digit")
-        steps.append("---- | ------- | --------------- | --------- | -----")
-        step_num = 1
+    steps.append(f"Starting decimal to base {base} conversion of {working_n}:")
+    steps.extend(DEC_TO_BASE_HEADER)
+    step_num = 1
     
     while working_n:
         remainder = working_n % base
         digit = BASE_DIGITS[remainder]
-        if show_steps:
-            steps.append(f"{step_num:4} | {working_n:7} | {base:15} | {remainder:9} | {digit}")
+        steps.append(f"{step_num:4} | {working_n:7} | {base:15} | {remainder:9} | {digit}")
         digits.append(digit)
         working_n = working_n // base
-        step_num += 1 if show_steps else 0
+        step_num += 1
     
     result = "".join(reversed(digits))
     final_result = f"-{result}" if is_negative else result
     
-    if show_steps:
-        steps.append(f"Reading remainders from bottom to top: {result}")
-        if is_negative:
-            steps.append(f"Adding negative sign: {final_result}")
-        steps.append(f"Final result: {original_n} in decimal = {final_result} in base {base}")
-        return final_result, steps
+    steps.append(f"Reading remainders from bottom to top: {result}")
+    if is_negative:
+        steps.append(f"Adding negative sign: {final_result}")
+    steps.append(f"Final result: {original_n} in decimal = {final_result} in base {base}")
+    return final_result, steps
+
+
+def _int_max_str_digits() -> int:
+    """Longest string int() accepts for non-power-of-two bases (unlimited if unsupported)."""
+    limit = sys.get_int_max_str_digits() if hasattr(sys, "get_int_max_str_digits") else 0
+    # 0 disables the limit
+    return limit or sys.maxsize
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _base_to_dec_value(number_str: str, base: int, error: str) -> int:
+    """Validate and decode a number string in the given base, raising ValueError(error) if invalid."""
+    is_negative = number_str.startswith('-')
+    digits = number_str[1:] if is_negative else number_str
+    if not BASE_RES[base].fullmatch(digits.upper()):
+        raise ValueError(error)
     
-    return final_result
+    if base & (base - 1) == 0 or len(digits) <= _int_max_str_digits():
+        value = int(digits, base)
+    else:
+        # int() refuses long strings in non-power-of-two bases (CPython 3.11+)
+        value = 0
+        for digit in digits:
+            value = value * base + DIGIT_VALUES[digit]
+    return -value if is_negative else value
 
 
 def base_to_dec(number_str: str, base: int, show_steps: bool = False) -> Union[int, Tuple[int, List[str]]]:
@@ -176,6 +405,9 @@ def base_to_dec(number_str: str, base: int, show_steps: bool = False) -> Union[i
     if not MIN_BASE <= base <= MAX_BASE:
         raise ValueError(f"Base must be between {MIN_BASE} and {MAX_BASE}")
     
+    if not show_steps:
+        return _base_to_dec_value(number_str, base, f"Invalid number for base {base}")
+    
     # Handle negative numbers
     is_negative = number_str.startswith('-')
     if is_negative:
@@ -183,37 +415,36 @@ def base_to_dec(number_str: str, base: int, show_steps: bool = False) -> Union[i
         number_str = number_str[1:]
         steps.append(f"Removing negative sign for conversion: {number_str}")
     
+    # Normalize once for both validation and the digit loop
+    number_str = number_str.upper()
+    
     # Validate the number string
-    valid_chars = BASE_DIGITS[:base]
-    if not re.fullmatch(f"[{valid_chars}]+" , number_str.upper()):
+    if not BASE_RES[base].fullmatch(number_str):
         raise ValueError(f"Invalid number for base {base}")
     
-    if show_steps:
-        steps.append(f"Starting base {base} to decimal conversion of {number_str}:")
-        steps.append("Position | Digit | Digit Value | Value = Digit Value × {base}^Position".format(base=base))
-        steps.append("-------- | ----- | ----------- | -----------------------------------------")
+    steps.append(f"Starting base {base} to decimal conversion of {number_str}:")
+    steps.extend(BASE_TO_DEC_HEADERS[base])
     
     decimal_value = 0
+    place_value = 1
+    last = len(number_str) - 1
     # Process from right to left (least significant digit to most significant digit)
-    for i, digit in enumerate(reversed(number_str.upper())):
-        digit_value = BASE_DIGITS.index(digit)
-        position_value = digit_value * (base ** i)
+    for i in range(last + 1):
+        digit = number_str[last - i]
+        digit_value = DIGIT_VALUES[digit]
+        position_value = digit_value * place_value
         decimal_value += position_value
+        place_value *= base
         
-        if show_steps:
-            steps.append(f"{i:8} | {digit:5} | {digit_value:11} | {position_value:38}")
+        steps.append(f"{i:8} | {digit:5} | {digit_value:11} | {position_value:38}")
     
     # Apply negative sign if needed
     if is_negative:
         decimal_value = -decimal_value
-        if show_steps:
-            steps.append(f"Applying negative sign: {decimal_value}")
-    
-    if show_steps:
-        steps.append(f"Final result: {original_str} in base {base} = {decimal_value} in decimal")
-        return decimal_value, steps
+        steps.append(f"Applying negative sign: {decimal_value}")
     
-    return decimal_value
+    steps.append(f"Final result: {original_str} in base {base} = {decimal_value} in decimal")
+    return decimal_value, steps
 
 # ---------- Floating-point conversion functions
 
@@ -245,9 +476,10 @@ def dec_to_base_float(decimal: float, base: int, precision: int = 10, show_steps
     # Handle negative numbers
     is_negative = decimal < 0
     if is_negative:
-        steps.append(f"Converting negative number: {original_decimal}")
         decimal = abs(decimal)
-        steps.append(f"Taking absolute value: {decimal}")
+        if show_steps:
+            steps.append(f"Converting negative number: {original_decimal}")
+            steps.append(f"Taking absolute value: {decimal}")
     
     # Separate integer and fractional parts
     int_part = int(decimal)
@@ -256,32 +488,31 @@ def dec_to_base_float(decimal: float, base: int, precision: int = 10, show_steps
     # Convert integer part
     int_result = dec_to_base(int_part, base)
     
-    # Convert fractional part
-    frac_result = []
+    # Convert fractional part into a preallocated buffer
+    frac_digits = bytearray(max(precision, 0))  # a negative precision yields no digits, like range()
+    num_digits = 0
     working_frac = frac_part
     
     if show_steps:
         steps.append(f"Converting integer part {int_part}: {int_result}")
         steps.append(f"Converting fractional part {frac_part}:")
-        steps.append("Step | Fractional | Multiplied by Base | Result    | Integer Part")
-        steps.append("---- | ---------- | ------------------ | --------- | ------------")
-        step_num = 1
+        steps.extend(FLOAT_FRACTION_HEADER)
     
-    for _ in range(precision):
+    while num_digits < precision:
         working_frac *= base
         int_digit = int(working_frac)
-        frac_result.append(BASE_DIGITS[int_digit])
+        frac_digits[num_digits] = BASE_DIGIT_BYTES[int_digit]
+        num_digits += 1
         
         if show_steps:
-            steps.append(f"{step_num:4} | {working_frac/base:10.6f} | {base:20} | {working_frac:9.6f} | {int_digit:12}")
-            step_num += 1
+            steps.append(f"{num_digits:4} | {working_frac/base:10.6f} | {base:20} | {working_frac:9.6f} | {int_digit:12}")
         
         working_frac -= int_digit
         if working_frac == 0:
             break
     
     # Combine results
-    result = f"{int_result}.{''.join(frac_result)}" if frac_result else int_result
+    result = f"{int_result}.{frac_digits[:num_digits].decode('ascii')}" if num_digits else int_result
     final_result = f"-{result}" if is_negative else result
     
     if show_steps:
@@ -354,39 +585,57 @@ def ascii_to_char(code_point: int, show_steps: bool = False) -> Union[str, Tuple
 
 # ---------- Utility functions
 
-def detect_base(number_str: str) -> int:
+def detect_base(number_str: str, show_steps: bool = False) -> Union[int, Tuple[int, List[str]]]:
     """
     Detect the base of a number string based on prefix or format.
     
     Args:
         number_str: Number string to detect
+        show_steps: Whether to return the detection step
         
     Returns:
-        Detected base (2, 8, 10, 16) or 0 if unknown
+        Either the detected base (2, 8, 10, 16, or 0 if unknown) or a tuple of (base, steps list)
     """
+    base = _detect_base(number_str)
+    if show_steps:
+        return base, [f"Detected base for '{number_str}': {base}"]
+    return base
+
+def _detect_base(number_str: str) -> int:
+    """Detect the base of a number string; see detect_base."""
     number_str = number_str.strip()
     
     # Check for prefixes
-    if number_str.lower().startswith('0b'):
-        return 2
-    elif number_str.lower().startswith('0o'):
-        return 8
-    elif number_str.lower().startswith('0x'):
-        return 16
-    
-    # Check format
-    if re.fullmatch(r'-?[01]+', number_str):
-        return 2
-    elif re.fullmatch(r'-?[0-7]+', number_str):
-        return 8
-    elif re.fullmatch(r'-?[0-9]+', number_str):
-        return 10
-    elif re.fullmatch(r'-?[0-9A-Fa-f]+', number_str):
-        return 16
-    
-    return 0
+    prefix_base = PREFIX_BASES.get(number_str[:2].lower())
+    if prefix_base:
+        return prefix_base
+    
+    # Check format in one pass, tracking the widest digit category seen
+    digits = number_str[1:] if number_str.startswith('-') else number_str
+    if not digits:
+        return 0
+    
+    category = 0
+    for digit in digits:
+        digit_category = DIGIT_CATEGORIES.get(digit, -1)
+        if digit_category < 0:
+            return 0
+        if digit_category > category:
+            category = digit_category
+    
+    return CATEGORY_BASES[category]
 
 # ---------- decimal to ...
+@lru_cache(maxsize=CACHE_SIZE)
+def _dec_to_bin_digits(n: int) -> str:
+    """Render a non-zero integer in binary without recording steps."""
+    if n < 0:
+        # Same two's complement width as the stepwise path in dec_to_bin
+        bits_needed = n.bit_length() + 1  # +1 for sign bit
+        return "-" + format(n & ((1 << bits_needed) - 1), f"0{bits_needed}b")
+    return format(n, "b")
+
+
 def dec_to_bin(n: int, show_steps: bool = False) -> Union[str, Tuple[str, List[str]]]:
     """
     Convert a decimal integer to its binary representation.
@@ -408,6 +657,9 @@ def dec_to_bin(n: int, show_steps: bool = False) -> Union[str, Tuple[str, List[s
             return "0", steps
         return "0"
     
+    if not show_steps:
+        return _dec_to_bin_digits(n)
+    
     is_negative = n < 0
     if is_negative:
         steps.append(f"Converting negative number: {original_n}")
@@ -421,31 +673,25 @@ def dec_to_bin(n: int, show_steps: bool = False) -> Union[str, Tuple[str, List[s
     bits = []
     working_n = n
     
-    if show_steps:
-        steps.append(f"Starting decimal to binary conversion of {working_n}:")
-        steps.append("Step | Decimal | Divided by 2 | Remainder")
-        steps.append("---- | ------- | ------------ | ---------")
-        step_num = 1
+    steps.append(f"Starting decimal to binary conversion of {working_n}:")
+    steps.extend(DEC_TO_BIN_HEADER)
+    step_num = 1
     
     while working_n:
         remainder = working_n & 1
-        if show_steps:
-            steps.append(f"{step_num:4} | {working_n:7} | 2           | {remainder}")
+        steps.append(f"{step_num:4} | {working_n:7} | 2           | {remainder}")
         bits.append(str(remainder))
         working_n >>= 1
-        step_num += 1 if show_steps else 0
+        step_num += 1
     
     result = "".join(reversed(bits))
     final_result = f"-{result}" if is_negative else result
     
-    if show_steps:
-        steps.append(f"Reading remainders from bottom to top: {result}")
-        if is_negative:
-            steps.append(f"Adding negative sign: {final_result}")
-        steps.append(f"Final result: {original_n} in decimal = {final_result} in binary")
-        return final_result, steps
-    
-    return final_result
+    steps.append(f"Reading remainders from bottom to top: {result}")
+    if is_negative:
+        steps.append(f"Adding negative sign: {final_result}")
+    steps.append(f"Final result: {original_n} in decimal = {final_result} in binary")
+    return final_result, steps
 
 
 def dec_to_oct(n: int, show_steps: bool = False) -> Union[str, Tuple[str, List[str]]]:
@@ -468,6 +714,9 @@ def dec_to_oct(n: int, show_steps: bool = False) -> Union[str, Tuple[str, List[s
             return "0", steps
         return "0"
     
+    if not show_steps:
+        return format(n, "o")
+    
     is_negative = n < 0
     if is_negative:
         steps.append(f"Converting negative number: {original_n}")
@@ -477,31 +726,25 @@ def dec_to_oct(n: int, show_steps: bool = False) -> Union[str, Tuple[str, List[s
     chars = []
     working_n = n
     
-    if show_steps:
-        steps.append(f"Starting decimal to octal conversion of {working_n}:")
-        steps.append("Step | Decimal | Divided by 8 | Remainder")
-        steps.append("---- | ------- | ------------ | ---------")
-        step_num = 1
+    steps.append(f"Starting decimal to octal conversion of {working_n}:")
+    steps.extend(DEC_TO_OCT_HEADER)
+    step_num = 1
     
     while working_n:
         remainder = working_n & 7
-        if show_steps:
-            steps.append(f"{step_num:4} | {working_n:7} | 8           | {remainder}")
+        steps.append(f"{step_num:4} | {working_n:7} | 8           | {remainder}")
         chars.append(str(remainder))
         working_n >>= 3
-        step_num += 1 if show_steps else 0
+        step_num += 1
     
     result = "".join(reversed(chars))
     final_result = f"-{result}" if is_negative else result
     
-    if show_steps:
-        steps.append(f"Reading remainders from bottom to top: {result}")
-        if is_negative:
-            steps.append(f"Adding negative sign: {final_result}")
-        steps.append(f"Final result: {original_n} in decimal = {final_result} in octal")
-        return final_result, steps
-    
-    return final_result
+    steps.append(f"Reading remainders from bottom to top: {result}")
+    if is_negative:
+        steps.append(f"Adding negative sign: {final_result}")
+    steps.append(f"Final result: {original_n} in decimal = {final_result} in octal")
+    return final_result, steps
 
 
 def dec_to_hex(n: int, show_steps: bool = False) -> Union[str, Tuple[str, List[str]]]:
@@ -524,6 +767,9 @@ def dec_to_hex(n: int, show_steps: bool = False) -> Union[str, Tuple[str, List[s
             return "0", steps
         return "0"
     
+    if not show_steps:
+        return format(n, "X")
+    
     is_negative = n < 0
     if is_negative:
         steps.append(f"Converting negative number: {original_n}")
@@ -533,32 +779,26 @@ def dec_to_hex(n: int, show_steps: bool = False) -> Union[str, Tuple[str, List[s
     chars = []
     working_n = n
     
-    if show_steps:
-        steps.append(f"Starting decimal to hexadecimal conversion of {working_n}:")
-        steps.append("Step | Decimal | Divided by 16 | Remainder | Hex Digit")
-        steps.append("---- | ------- | ------------ | --------- | ---------")
-        step_num = 1
+    steps.append(f"Starting decimal to hexadecimal conversion of {working_n}:")
+    steps.extend(DEC_TO_HEX_HEADER)
+    step_num = 1
     
     while working_n:
         remainder = working_n & 15
         hex_digit = HEX_DIGITS[remainder]
-        if show_steps:
-            steps.append(f"{step_num:4} | {working_n:7} | 16          | {remainder:9} | {hex_digit}")
+        steps.append(f"{step_num:4} | {working_n:7} | 16          | {remainder:9} | {hex_digit}")
         chars.append(hex_digit)
         working_n >>= 4
-        step_num += 1 if show_steps else 0
+        step_num += 1
     
     result = "".join(reversed(chars))
     final_result = f"-{result}" if is_negative else result
     
-    if show_steps:
-        steps.append(f"Reading remainders from bottom to top: {result}")
-        if is_negative:
-            steps.append(f"Adding negative sign: {final_result}")
-        steps.append(f"Final result: {original_n} in decimal = {final_result} in hexadecimal")
-        return final_result, steps
-    
-    return final_result
+    steps.append(f"Reading remainders from bottom to top: {result}")
+    if is_negative:
+        steps.append(f"Adding negative sign: {final_result}")
+    steps.append(f"Final result: {original_n} in decimal = {final_result} in hexadecimal")
+    return final_result, steps
 
 
 # ---------- string to decimal (validation + built-in int())
@@ -606,6 +846,9 @@ def bin_to_dec(bstr: str, show_steps: bool = False) -> Union[int, Tuple[int, Lis
     steps = []
     original_bstr = bstr
     
+    if not show_steps:
+        return _base_to_dec_value(bstr, 2, "Invalid binary number")
+    
     # Handle negative numbers
     is_negative = bstr.startswith('-')
     if is_negative:
@@ -614,35 +857,32 @@ def bin_to_dec(bstr: str, show_steps: bool = False) -> Union[int, Tuple[int, Lis
         steps.append(f"Removing negative sign for conversion: {bstr}")
     
     # Validate the binary string
-    if not re.fullmatch(r"[01]+", bstr):
+    if not BIN_RE.fullmatch(bstr):
         raise ValueError("Invalid binary number")
     
-    if show_steps:
-        steps.append(f"Starting binary to decimal conversion of {bstr}:")
-        steps.append("Position | Digit | Value = Digit × 2^Position")
-        steps.append("-------- | ----- | --------------------------")
+    steps.append(f"Starting binary to decimal conversion of {bstr}:")
+    steps.extend(BIN_TO_DEC_HEADER)
     
     decimal_value = 0
+    place_value = 1
+    last = len(bstr) - 1
     # Process from right to left (least significant bit to most significant bit)
-    for i, digit in enumerate(reversed(bstr)):
-        digit_value = int(digit)
-        position_value = digit_value * (2 ** i)
+    for i in range(last + 1):
+        digit = bstr[last - i]
+        digit_value = DIGIT_VALUES[digit]
+        position_value = digit_value * place_value
         decimal_value += position_value
+        place_value *= 2
         
-        if show_steps:
-            steps.append(f"{i:8} | {digit:5} | {position_value:24}")
+        steps.append(f"{i:8} | {digit:5} | {position_value:24}")
     
     # Apply negative sign if needed
     if is_negative:
         decimal_value = -decimal_value
-        if show_steps:
-            steps.append(f"Applying negative sign: {decimal_value}")
-    
-    if show_steps:
-        steps.append(f"Final result: {original_bstr} in binary = {decimal_value} in decimal")
-        return decimal_value, steps
+        steps.append(f"Applying negative sign: {decimal_value}")
     
-    return decimal_value
+    steps.append(f"Final result: {original_bstr} in binary = {decimal_value} in decimal")
+    return decimal_value, steps
 
 def oct_to_dec(ostr: str, show_steps: bool = False) -> Union[int, Tuple[int, List[str]]]:
     """
@@ -658,6 +898,9 @@ def oct_to_dec(ostr: str, show_steps: bool = False) -> Union[int, Tuple[int, Lis
     steps = []
     original_ostr = ostr
     
+    if not show_steps:
+        return _base_to_dec_value(ostr, 8, "Invalid octal number")
+    
     # Handle negative numbers
     is_negative = ostr.startswith('-')
     if is_negative:
@@ -666,35 +909,32 @@ def oct_to_dec(ostr: str, show_steps: bool = False) -> Union[int, Tuple[int, Lis
         steps.append(f"Removing negative sign for conversion: {ostr}")
     
     # Validate the octal string
-    if not re.fullmatch(r"[0-7]+", ostr):
+    if not OCT_RE.fullmatch(ostr):
         raise ValueError("Invalid octal number")
     
-    if show_steps:
-        steps.append(f"Starting octal to decimal conversion of {ostr}:")
-        steps.append("Position | Digit | Value = Digit × 8^Position")
-        steps.append("-------- | ----- | --------------------------")
+    steps.append(f"Starting octal to decimal conversion of {ostr}:")
+    steps.extend(OCT_TO_DEC_HEADER)
     
     decimal_value = 0
+    place_value = 1
+    last = len(ostr) - 1
     # Process from right to left (least significant digit to most significant digit)
-    for i, digit in enumerate(reversed(ostr)):
-        digit_value = int(digit)
-        position_value = digit_value * (8 ** i)
+    for i in range(last + 1):
+        digit = ostr[last - i]
+        digit_value = DIGIT_VALUES[digit]
+        position_value = digit_value * place_value
         decimal_value += position_value
+        place_value *= 8
         
-        if show_steps:
-            steps.append(f"{i:8} | {digit:5} | {position_value:24}")
+        steps.append(f"{i:8} | {digit:5} | {position_value:24}")
     
     # Apply negative sign if needed
     if is_negative:
         decimal_value = -decimal_value
-        if show_steps:
-            steps.append(f"Applying negative sign: {decimal_value}")
+        steps.append(f"Applying negative sign: {decimal_value}")
     
-    if show_steps:
-        steps.append(f"Final result: {original_ostr} in octal = {decimal_value} in decimal")
-        return decimal_value, steps
-    
-    return decimal_value
+    steps.append(f"Final result: {original_ostr} in octal = {decimal_value} in decimal")
+    return decimal_value, steps
 
 def hex_to_dec(hstr: str, show_steps: bool = False) -> Union[int, Tuple[int, List[str]]]:
     """
@@ -711,6 +951,9 @@ def hex_to_dec(hstr: str, show_steps: bool = False) -> Union[int, Tuple[int, Lis
     original_hstr = hstr
     hstr = hstr.upper()  # Convert to uppercase for consistency
     
+    if not show_steps:
+        return _base_to_dec_value(hstr, 16, "Invalid hexadecimal number")
+    
     # Handle negative numbers
     is_negative = hstr.startswith('-')
     if is_negative:
@@ -719,38 +962,91 @@ def hex_to_dec(hstr: str, show_steps: bool = False) -> Union[int, Tuple[int, Lis
         steps.append(f"Removing negative sign for conversion: {hstr}")
     
     # Validate the hexadecimal string
-    if not re.fullmatch(r"[0-9A-F]+", hstr):
+    if not HEX_RE.fullmatch(hstr):
         raise ValueError("Invalid hexadecimal number")
     
-    if show_steps:
-        steps.append(f"Starting hexadecimal to decimal conversion of {hstr}:")
-        steps.append("Position | Digit | Digit Value | Value = Digit Value × 16^Position")
-        steps.append("-------- | ----- | ----------- | -----------------------------------")
+    steps.append(f"Starting hexadecimal to decimal conversion of {hstr}:")
+    steps.extend(HEX_TO_DEC_HEADER)
     
     decimal_value = 0
+    place_value = 1
+    last = len(hstr) - 1
     # Process from right to left (least significant digit to most significant digit)
-    for i, digit in enumerate(reversed(hstr)):
-        digit_value = HEX_DIGITS.index(digit)
-        position_value = digit_value * (16 ** i)
+    for i in range(last + 1):
+        digit = hstr[last - i]
+        digit_value = DIGIT_VALUES[digit]
+        position_value = digit_value * place_value
         decimal_value += position_value
+        place_value *= 16
         
-        if show_steps:
-            steps.append(f"{i:8} | {digit:5} | {digit_value:11} | {position_value:35}")
+        steps.append(f"{i:8} | {digit:5} | {digit_value:11} | {position_value:35}")
     
     # Apply negative sign if needed
     if is_negative:
         decimal_value = -decimal_value
-        if show_steps:
-            steps.append(f"Applying negative sign: {decimal_value}")
+        steps.append(f"Applying negative sign: {decimal_value}")
     
-    if show_steps:
-        steps.append(f"Final result: {original_hstr} in hexadecimal = {decimal_value} in decimal")
-        return decimal_value, steps
+    steps.append(f"Final result: {original_hstr} in hexadecimal = {decimal_value} in decimal")
+    return decimal_value, steps
+
+
+# ---------- cross conversions (bit regrouping, or via decimal with steps)
+def _cross_convert(number_str: str, src_to_dec: Callable, dec_to_tgt: Callable,
+                   src_name: str, tgt_name: str) -> Tuple[str, List[str]]:
+    """
+    Convert a number string between two bases via decimal, recording the steps.
     
-    return decimal_value
+    Args:
+        number_str: Number string to convert
+        src_to_dec: Converter from the source base to decimal
+        dec_to_tgt: Converter from decimal to the target base
+        src_name: Name of the source number system (for the steps)
+        tgt_name: Name of the target number system (for the steps)
+        
+    Returns:
+        A tuple of (converted string, steps list)
+    """
+    dec_value, src_steps = src_to_dec(number_str, show_steps=True)
+    result, tgt_steps = dec_to_tgt(dec_value, show_steps=True)
+    
+    # Assemble the steps in one go rather than appending/extending piecemeal
+    steps = [
+        f"Starting {src_name} to {tgt_name} conversion of {number_str}",
+        f"Step 1: Convert {src_name} to decimal",
+        SEPARATOR,
+        *src_steps,
+        "",
+        f"Step 2: Convert decimal to {tgt_name}",
+        SEPARATOR,
+        *tgt_steps,
+        "",
+        SEPARATOR,
+        f"Complete conversion: {number_str} ({src_name}) = {result} ({tgt_name})",
+    ]
+    
+    return result, steps
 
+def _regroup_bits(bstr: str, width: int) -> str:
+    """
+    Regroup a (possibly negative) binary string into base 2**width digits.
+    
+    Args:
+        bstr: Binary string to convert
+        width: Number of bits per target digit (3 for octal, 4 for hex)
+        
+    Returns:
+        The converted string, signed like the input
+    """
+    is_negative = bstr.startswith('-')
+    bits = bstr[1:] if is_negative else bstr
+    if not BIN_RE.fullmatch(bits):
+        raise ValueError("Invalid binary number")
+    
+    # int() and format() both run in linear time for power-of-two bases
+    result = format(int(bits, 2), FORMAT_SPECS[1 << width])
+    
+    return f"-{result}" if is_negative and result != "0" else result
 
-# ---------- cross conversions via decimal
 def bin_to_oct(bstr: str, show_steps: bool = False) -> Union[str, Tuple[str, List[str]]]:
     """Convert a binary string to octal string.
     
@@ -762,30 +1058,9 @@ def bin_to_oct(bstr: str, show_steps: bool = False) -> Union[str, Tuple[str, Lis
         Either the octal string or a tuple of (octal string, steps list)
     """
     if show_steps:
-        steps = []
-        steps.append(f"Starting binary to octal conversion of {bstr}")
-        steps.append("Step 1: Convert binary to decimal")
-        steps.append("=" * 50)
-        
-        # Convert binary to decimal with steps
-        dec_value, bin_to_dec_steps = bin_to_dec(bstr, show_steps=True)
-        steps.extend(bin_to_dec_steps)
-        
-        steps.append("")
-        steps.append("Step 2: Convert decimal to octal")
-        steps.append("=" * 50)
-        
-        # Convert decimal to octal with steps
-        oct_value, dec_to_oct_steps = dec_to_oct(dec_value, show_steps=True)
-        steps.extend(dec_to_oct_steps)
-        
-        steps.append("")
-        steps.append("=" * 50)
-        steps.append(f"Complete conversion: {bstr} (binary) = {oct_value} (octal)")
-        
-        return oct_value, steps
+        return _cross_convert(bstr, bin_to_dec, dec_to_oct, "binary", "octal")
     
-    return dec_to_oct(bin_to_dec(bstr))
+    return _regroup_bits(bstr, 3)
 
 def bin_to_hex(bstr: str, show_steps: bool = False) -> Union[str, Tuple[str, List[str]]]:
     """Convert a binary string to hexadecimal string.
@@ -798,30 +1073,9 @@ def bin_to_hex(bstr: str, show_steps: bool = False) -> Union[str, Tuple[str, Lis
         Either the hexadecimal string or a tuple of (hexadecimal string, steps list)
     """
     if show_steps:
-        steps = []
-        steps.append(f"Starting binary to hexadecimal conversion of {bstr}")
-        steps.append("Step 1: Convert binary to decimal")
-        steps.append("=" * 50)
-        
-        # Convert binary to decimal with steps
-        dec_value, bin_to_dec_steps = bin_to_dec(bstr, show_steps=True)
-        steps.extend(bin_to_dec_steps)
-        
-        steps.append("")
-        steps.append("Step 2: Convert decimal to hexadecimal")
-        steps.append("=" * 50)
-        
-        # Convert decimal to hexadecimal with steps
-        hex_value, dec_to_hex_steps = dec_to_hex(dec_value, show_steps=True)
-        steps.extend(dec_to_hex_steps)
-        
-        steps.append("")
-        steps.append("=" * 50)
-        steps.append(f"Complete conversion: {bstr} (binary) = {hex_value} (hexadecimal)")
-        
-        return hex_value, steps
+        return _cross_convert(bstr, bin_to_dec, dec_to_hex, "binary", "hexadecimal")
     
-    return dec_to_hex(bin_to_dec(bstr))
+    return _regroup_bits(bstr, 4)
 
 def oct_to_bin(ostr: str, show_steps: bool = False) -> Union[str, Tuple[str, List[str]]]:
     """Convert an octal string to binary string.
@@ -834,30 +1088,15 @@ def oct_to_bin(ostr: str, show_steps: bool = False) -> Union[str, Tuple[str, Lis
         Either the binary string or a tuple of (binary string, steps list)
     """
     if show_steps:
-        steps = []
-        steps.append(f"Starting octal to binary conversion of {ostr}")
-        steps.append("Step 1: Convert octal to decimal")
-        steps.append("=" * 50)
-        
-        # Convert octal to decimal with steps
-        dec_value, oct_to_dec_steps = oct_to_dec(ostr, show_steps=True)
-        steps.extend(oct_to_dec_steps)
-        
-        steps.append("")
-        steps.append("Step 2: Convert decimal to binary")
-        steps.append("=" * 50)
-        
-        # Convert decimal to binary with steps
-        bin_value, dec_to_bin_steps = dec_to_bin(dec_value, show_steps=True)
-        steps.extend(dec_to_bin_steps)
-        
-        steps.append("")
-        steps.append("=" * 50)
-        steps.append(f"Complete conversion: {ostr} (octal) = {bin_value} (binary)")
-        
-        return bin_value, steps
+        return _cross_convert(ostr, oct_to_dec, dec_to_bin, "octal", "binary")
+    
+    # Negative results use two's complement, which needs the decimal value
+    if ostr.startswith('-'):
+        return dec_to_bin(oct_to_dec(ostr))
     
-    return dec_to_bin(oct_to_dec(ostr))
+    if not OCT_RE.fullmatch(ostr):
+        raise ValueError("Invalid octal number")
+    return ostr.translate(OCT_TO_BIN).lstrip("0") or "0"
 
 def oct_to_hex(ostr: str, show_steps: bool = False) -> Union[str, Tuple[str, List[str]]]:
     """Convert an octal string to hexadecimal string.
@@ -870,30 +1109,16 @@ def oct_to_hex(ostr: str, show_steps: bool = False) -> Union[str, Tuple[str, Lis
         Either the hexadecimal string or a tuple of (hexadecimal string, steps list)
     """
     if show_steps:
-        steps = []
-        steps.append(f"Starting octal to hexadecimal conversion of {ostr}")
-        steps.append("Step 1: Convert octal to decimal")
-        steps.append("=" * 50)
-        
-        # Convert octal to decimal with steps
-        dec_value, oct_to_dec_steps = oct_to_dec(ostr, show_steps=True)
-        steps.extend(oct_to_dec_steps)
-        
-        steps.append("")
-        steps.append("Step 2: Convert decimal to hexadecimal")
-        steps.append("=" * 50)
-        
-        # Convert decimal to hexadecimal with steps
-        hex_value, dec_to_hex_steps = dec_to_hex(dec_value, show_steps=True)
-        steps.extend(dec_to_hex_steps)
-        
-        steps.append("")
-        steps.append("=" * 50)
-        steps.append(f"Complete conversion: {ostr} (octal) = {hex_value} (hexadecimal)")
-        
-        return hex_value, steps
+        return _cross_convert(ostr, oct_to_dec, dec_to_hex, "octal", "hexadecimal")
     
-    return dec_to_hex(oct_to_dec(ostr))
+    is_negative = ostr.startswith('-')
+    digits = ostr[1:] if is_negative else ostr
+    if not OCT_RE.fullmatch(digits):
+        raise ValueError("Invalid octal number")
+    
+    # Expand to 3-bit groups, then regroup into 4-bit hex digits
+    bits = digits.translate(OCT_TO_BIN)
+    return _regroup_bits(f"-{bits}" if is_negative else bits, 4)
 
 def hex_to_bin(hstr: str, show_steps: bool = False) -> Union[str, Tuple[str, List[str]]]:
     """Convert a hexadecimal string to binary string.
@@ -906,30 +1131,16 @@ def hex_to_bin(hstr: str, show_steps: bool = False) -> Union[str, Tuple[str, Lis
         Either the binary string or a tuple of (binary string, steps list)
     """
     if show_steps:
-        steps = []
-        steps.append(f"Starting hexadecimal to binary conversion of {hstr}")
-        steps.append("Step 1: Convert hexadecimal to decimal")
-        steps.append("=" * 50)
-        
-        # Convert hexadecimal to decimal with steps
-        dec_value, hex_to_dec_steps = hex_to_dec(hstr, show_steps=True)
-        steps.extend(hex_to_dec_steps)
-        
-        steps.append("")
-        steps.append("Step 2: Convert decimal to binary")
-        steps.append("=" * 50)
-        
-        # Convert decimal to binary with steps
-        bin_value, dec_to_bin_steps = dec_to_bin(dec_value, show_steps=True)
-        steps.extend(dec_to_bin_steps)
-        
-        steps.append("")
-        steps.append("=" * 50)
-        steps.append(f"Complete conversion: {hstr} (hexadecimal) = {bin_value} (binary)")
-        
-        return bin_value, steps
+        return _cross_convert(hstr, hex_to_dec, dec_to_bin, "hexadecimal", "binary")
     
-    return dec_to_bin(hex_to_dec(hstr))
+    # Negative results use two's complement, which needs the decimal value
+    if hstr.startswith('-'):
+        return dec_to_bin(hex_to_dec(hstr))
+    
+    hstr = hstr.upper()
+    if not HEX_RE.fullmatch(hstr):
+        raise ValueError("Invalid hexadecimal number")
+    return hstr.translate(HEX_TO_BIN).lstrip("0") or "0"
 
 def hex_to_oct(hstr: str, show_steps: bool = False) -> Union[str, Tuple[str, List[str]]]:
     """Convert a hexadecimal string to octal string.
@@ -942,30 +1153,16 @@ def hex_to_oct(hstr: str, show_steps: bool = False) -> Union[str, Tuple[str, Lis
         Either the octal string or a tuple of (octal string, steps list)
     """
     if show_steps:
-        steps = []
-        steps.append(f"Starting hexadecimal to octal conversion of {hstr}")
-        steps.append("Step 1: Convert hexadecimal to decimal")
-        steps.append("=" * 50)
-        
-        # Convert hexadecimal to decimal with steps
-        dec_value, hex_to_dec_steps = hex_to_dec(hstr, show_steps=True)
-        steps.extend(hex_to_dec_steps)
-        
-        steps.append("")
-        steps.append("Step 2: Convert decimal to octal")
-        steps.append("=" * 50)
-        
-        # Convert decimal to octal with steps
-        oct_value, dec_to_oct_steps = dec_to_oct(dec_value, show_steps=True)
-        steps.extend(dec_to_oct_steps)
-        
-        steps.append("")
-        steps.append("=" * 50)
-        steps.append(f"Complete conversion: {hstr} (hexadecimal) = {oct_value} (octal)")
-        
-        return oct_value, steps
+        return _cross_convert(hstr, hex_to_dec, dec_to_oct, "hexadecimal", "octal")
+    
+    is_negative = hstr.startswith('-')
+    digits = (hstr[1:] if is_negative else hstr).upper()
+    if not HEX_RE.fullmatch(digits):
+        raise ValueError("Invalid hexadecimal number")
     
-    return dec_to_oct(hex_to_dec(hstr))
+    # Expand to 4-bit groups, then regroup into 3-bit octal digits
+    bits = digits.translate(HEX_TO_BIN)
+    return _regroup_bits(f"-{bits}" if is_negative else bits, 3)
 
 
 # ------------------------------------------------------------------
@@ -1010,11 +1207,26 @@ def read_int(prompt: str) -> int:
             print("✗  Please enter a valid integer")
 
 
+def is_signed_number(s: str, allowed: frozenset) -> bool:
+    """
+    Check that a string is an optional '-' followed by one or more allowed characters.
+    
+    Args:
+        s: The string to check
+        allowed: The set of valid digit characters
+        
+    Returns:
+        True if the string is a valid signed number
+    """
+    digits = s[1:] if s.startswith('-') else s
+    return bool(digits) and allowed.issuperset(digits)
+
+
 def read_bin() -> str:
     """Read a binary number from user input."""
     return read_number(
         "Enter binary: ", 
-        lambda s: bool(re.fullmatch(r"-?[01]+", s)),
+        lambda s: is_signed_number(s, BIN_CHARS),
         "Invalid binary number (use only 0 and 1, optional negative sign)"
     )
 
@@ -1022,17 +1234,19 @@ def read_oct() -> str:
     """Read an octal number from user input."""
     return read_number(
         "Enter octal: ", 
-        lambda s: bool(re.fullmatch(r"-?[0-7]+", s)),
+        lambda s: is_signed_number(s, OCT_CHARS),
         "Invalid octal number (use only 0-7, optional negative sign)"
     )
 
 def read_hex() -> str:
     """Read a hexadecimal number from user input."""
-    return read_number(
+    s = read_number(
         "Enter hexadecimal: ", 
-        lambda s: bool(re.fullmatch(r"-?[0-9A-Fa-f]+", s)),
+        lambda s: is_signed_number(s, HEX_CHARS),
         "Invalid hexadecimal number (use only 0-9, A-F, a-f, optional negative sign)"
-    ).upper()
+    )
+    # Interning lets repeated entries share one string
+    return sys.intern(s.upper())
 
 
 def toggle_color_scheme() -> str:
@@ -1044,6 +1258,7 @@ def toggle_color_scheme() -> str:
     """
     global CURRENT_SCHEME
     global colors
+    global _menu_cache
     
     if CURRENT_SCHEME == 'dark':
         CURRENT_SCHEME = 'light'
@@ -1051,47 +1266,98 @@ def toggle_color_scheme() -> str:
         CURRENT_SCHEME = 'dark'
     
     colors = Colors(CURRENT_SCHEME)
+    _menu_cache = None
     return f"Color scheme changed to {CURRENT_SCHEME}"
 
 
 # ------------------------------------------------------------------
 # 3. Menu system and application logic
 # ------------------------------------------------------------------
-CONVERSIONS: Dict[int, Tuple[str, Callable]] = {
+def _toggle_color_scheme_steps(show_steps: bool = True) -> Tuple[str, List[str]]:
+    """Toggle the color scheme, reporting the confirmation as the only step."""
+    message = toggle_color_scheme()
+    return message, [message]
+
+# Menu sections as (title, color attribute name); colors are looked up at print
+# time because toggle_color_scheme rebinds them. Every hexadecimal conversion
+# pairs with decimal, binary or octal, so there is no hex section.
+MENU_SECTIONS: List[Tuple[str, str]] = [
+    ("Decimal Conversions", "GREEN"),
+    ("Binary Conversions", "BLUE"),
+    ("Octal Conversions", "CYAN"),
+    ("Advanced Features", "PURPLE"),
+]
+
+# One record per option: (key, description, section index, reader, converter).
+# The reader prompts for the converter's arguments; the converter is called
+# with show_steps=True.
+MENU_TABLE: Tuple[Tuple[int, str, int, Callable[[], Tuple[Any, ...]], Callable[..., Any]], ...] = (
     # decimal
-    1:  ("Decimal → Binary", lambda: dec_to_bin(read_int("Enter decimal: "))),
-    2:  ("Binary → Decimal", lambda: bin_to_dec(read_bin())),
-    3:  ("Decimal → Octal",  lambda: dec_to_oct(read_int("Enter decimal: "))),
-    4:  ("Octal → Decimal",  lambda: oct_to_dec(read_oct())),
-    5:  ("Decimal → Hex",    lambda: dec_to_hex(read_int("Enter decimal: "))),
-    6:  ("Hex → Decimal",    lambda: hex_to_dec(read_hex())),
+    (1,  "Decimal → Binary", 0, lambda: (read_int("Enter decimal number: "),), dec_to_bin),
+    (2,  "Binary → Decimal", 0, lambda: (read_bin(),), bin_to_dec),
+    (3,  "Decimal → Octal",  0, lambda: (read_int("Enter decimal number: "),), dec_to_oct),
+    (4,  "Octal → Decimal",  0, lambda: (read_oct(),), oct_to_dec),
+    (5,  "Decimal → Hex",    0, lambda: (read_int("Enter decimal number: "),), dec_to_hex),
+    (6,  "Hex → Decimal",    0, lambda: (read_hex(),), hex_to_dec),
     # binary ↔ octal / hex
-    7:  ("Binary → Octal",   lambda: bin_to_oct(read_bin())),
-    8:  ("Octal → Binary",   lambda: oct_to_bin(read_oct())),
-    9:  ("Binary → Hex",     lambda: bin_to_hex(read_bin())),
-    10: ("Hex → Binary",     lambda: hex_to_bin(read_hex())),
-    11: ("Octal → Hex",      lambda: oct_to_hex(read_oct())),
-    12: ("Hex → Octal",      lambda: hex_to_oct(read_hex())),
+    (7,  "Binary → Octal",   1, lambda: (read_bin(),), bin_to_oct),
+    (8,  "Octal → Binary",   1, lambda: (read_oct(),), oct_to_bin),
+    (9,  "Binary → Hex",     1, lambda: (read_bin(),), bin_to_hex),
+    (10, "Hex → Binary",     1, lambda: (read_hex(),), hex_to_bin),
+    (11, "Octal → Hex",      2, lambda: (read_oct(),), oct_to_hex),
+    (12, "Hex → Octal",      2, lambda: (read_hex(),), hex_to_oct),
     # Advanced features
-    13: ("Decimal → Any Base (2-16)", lambda: dec_to_base(read_int("Enter decimal: "), read_int("Enter target base (2-16): "))),
-    14: ("Any Base (2-16) → Decimal", lambda: base_to_dec(input("Enter number: "), read_int("Enter source base (2-16): "))),
-    15: ("Decimal Float → Any Base", lambda: dec_to_base_float(float(input("Enter decimal float: ")), read_int("Enter target base (2-16): "))),
-    16: ("ASCII → Character", lambda: ascii_to_char(read_int("Enter ASCII code: "))),
-    17: ("Character → ASCII", lambda: char_to_ascii(input("Enter character: "))),
-    18: ("Number Base Detection", lambda: detect_base(input("Enter number: "))),
-    19: ("Toggle Color Scheme", lambda: toggle_color_scheme()),
+    (13, "Decimal → Any Base (2-16)", 3,
+     lambda: (read_int("Enter decimal number: "), read_int("Enter target base (2-16): ")), dec_to_base),
+    (14, "Any Base (2-16) → Decimal", 3,
+     lambda: (input("Enter number: "), read_int("Enter source base (2-16): ")), base_to_dec),
+    (15, "Decimal Float → Any Base", 3,
+     lambda: (float(input("Enter decimal float: ")), read_int("Enter target base (2-16): ")), dec_to_base_float),
+    (16, "ASCII → Character", 3, lambda: (read_int("Enter ASCII code: "),), ascii_to_char),
+    (17, "Character → ASCII", 3, lambda: (input("Enter character: "),), char_to_ascii),
+    (18, "Number Base Detection", 3, lambda: (input("Enter number: "),), detect_base),
+    (19, "Toggle Color Scheme", 3, tuple, _toggle_color_scheme_steps),
+)
+
+# Lookups derived once from MENU_TABLE
+CONVERSIONS: Dict[int, Tuple[str, Callable[..., Any]]] = {
+    key: (desc, converter) for key, desc, _, _, converter in MENU_TABLE
 }
+MENU_READERS: Dict[int, Callable[[], Tuple[Any, ...]]] = {key: reader for key, _, _, reader, _ in MENU_TABLE}
+MENU_CHOICES: Dict[str, int] = {str(key): key for key, _, _, _, _ in MENU_TABLE}
+MENU_GROUPS: List[Tuple[str, str, List[int]]] = [
+    (title, color_name, [key for key, _, section, _, _ in MENU_TABLE if section == index])
+    for index, (title, color_name) in enumerate(MENU_SECTIONS)
+]
+
+def _render_menu() -> str:
+    """
+    Render the conversion menu for the current color scheme and cache it.
+    
+    Returns:
+        The full colored menu text, ending with the Quit option
+    """
+    global _menu_cache
+    
+    parts = [f"\n{colors.BOLD}{colors.PURPLE}Available Conversions:{colors.RESET}\n"]
+    for title, color_name, keys in MENU_GROUPS:
+        parts.append(f"\n{colors.BOLD}{getattr(colors, color_name)}{title}:{colors.RESET}\n")
+        for k in keys:
+            parts.append(f"{colors.OPTION}{k:2}){colors.RESET} {CONVERSIONS[k][0]}\n")
+    parts.append(f"\n{colors.OPTION}20){colors.RESET} Quit")
+    _menu_cache = "".join(parts)
+    return _menu_cache
 
 def print_header() -> None:
     """Print the application header with version information and colors."""
     header = f"""
-{colors.BOLD}{colors.CYAN}╔══════════════════════════════════════════════════════╗{colors.RESET}
-{colors.BOLD}{colors.GREEN}║                  Advanced Number Base Converter      ║{colors.RESET}
+{colors.HEADER}╔══════════════════════════════════════════════════════╗{colors.RESET}
+{colors.SUCCESS}║                  Advanced Number Base Converter      ║{colors.RESET}
 {colors.BOLD}{colors.BLUE}║                        Version {VERSION}              ║{colors.RESET}
-{colors.BOLD}{colors.CYAN}╚══════════════════════════════════════════════════════╝{colors.RESET}
+{colors.HEADER}╚══════════════════════════════════════════════════════╝{colors.RESET}
 {colors.BOLD}{colors.PURPLE}║                    Author: {AUTHOR}                  ║{colors.RESET}
 {colors.BOLD}{colors.PURPLE}║                  GitHub: {GITHUB}                   ║{colors.RESET}
-{colors.BOLD}{colors.CYAN}╚══════════════════════════════════════════════════════╝{colors.RESET}
+{colors.HEADER}╚══════════════════════════════════════════════════════╝{colors.RESET}
 """
     print(header)
 
@@ -1102,172 +1368,70 @@ def display_result(result: Union[int, str]) -> None:
     Args:
         result: The result to display
     """
-    print("\n" + "=" * 50)
+    print("\n" + SEPARATOR)
     print(f"Result: {result}")
-    print("=" * 50)
+    print(SEPARATOR)
 
 def menu() -> None:
     """Display the main menu and handle user choices."""
     print_header()
     
     while True:
-        print(f"\n{colors.BOLD}{colors.PURPLE}Available Conversions:{colors.RESET}")
-        # Group conversions by type for better readability
-        decimal_group = [k for k, (desc, _) in CONVERSIONS.items() if "Decimal" in desc and "Any Base" not in desc]
-        binary_group = [k for k, (desc, _) in CONVERSIONS.items() if "Binary" in desc and "Decimal" not in desc]
-        octal_group = [k for k, (desc, _) in CONVERSIONS.items() if "Octal" in desc and "Decimal" not in desc and "Binary" not in desc]
-        hex_group = [k for k, (desc, _) in CONVERSIONS.items() if "Hex" in desc and "Decimal" not in desc and "Binary" not in desc and "Octal" not in desc]
-        advanced_group = [k for k, (desc, _) in CONVERSIONS.items() if any(keyword in desc for keyword in ["Any Base", "Float", "ASCII", "Detection", "Color Scheme"])]
-        
-        # Print decimal conversions first
-        if decimal_group:
-            print(f"\n{colors.BOLD}{colors.GREEN}Decimal Conversions:{colors.RESET}")
-            for k in decimal_group:
-                print(f"{colors.BOLD}{colors.YELLOW}{k:2}){colors.RESET} {CONVERSIONS[k][0]}")
-        
-        # Print other groups
-        if binary_group:
-            print(f"\n{colors.BOLD}{colors.BLUE}Binary Conversions:{colors.RESET}")
-            for k in binary_group:
-                print(f"{colors.BOLD}{colors.YELLOW}{k:2}){colors.RESET} {CONVERSIONS[k][0]}")
-        
-        if octal_group:
-            print(f"\n{colors.BOLD}{colors.CYAN}Octal Conversions:{colors.RESET}")
-            for k in octal_group:
-                print(f"{colors.BOLD}{colors.YELLOW}{k:2}){colors.RESET} {CONVERSIONS[k][0]}")
-        
-        if hex_group:
-            print(f"\n{colors.BOLD}{colors.RED}Hexadecimal Conversions:{colors.RESET}")
-            for k in hex_group:
-                print(f"{colors.BOLD}{colors.YELLOW}{k:2}){colors.RESET} {CONVERSIONS[k][0]}")
-        
-        # Print advanced features
-        if advanced_group:
-            print(f"\n{colors.BOLD}{colors.PURPLE}Advanced Features:{colors.RESET}")
-            for k in advanced_group:
-                print(f"{colors.BOLD}{colors.YELLOW}{k:2}){colors.RESET} {CONVERSIONS[k][0]}")
-        
-        print(f"\n{colors.BOLD}{colors.YELLOW}20){colors.RESET} Quit")
+        sys.stdout.write((_menu_cache or _render_menu()) + "\n")
         
         try:
             choice = input("\nSelect an option (1-20): ").strip()
             if choice == "20":
-                print(f"\n{colors.BOLD}{colors.GREEN}Thank you for using Advanced Number Base Converter. Good-bye!{colors.RESET}")
-                sys.exit(0)
+                print(f"\n{colors.SUCCESS}Thank you for using Advanced Number Base Converter. Good-bye!{colors.RESET}")
+                return
             
-            if not choice.isdigit() or int(choice) not in CONVERSIONS:
+            # Exact lookup (leading zeros allowed, as with isdigit()/int()); rejects "+3", "1_9", ...
+            option_num = MENU_CHOICES.get(choice.lstrip("0"))
+            if option_num is None:
                 print("✗  Invalid choice. Please enter a number between 1 and 20.")
                 continue
             
             # Execute the selected conversion
-            option_num = int(choice)
-            conversion_name, conversion_func = CONVERSIONS[option_num]
+            conversion_name, converter = CONVERSIONS[option_num]
             
             # Display conversion header with colors
-            print(f"\n{colors.BOLD}{colors.CYAN}{'=' * 50}{colors.RESET}")
-            print(f"{colors.BOLD}{colors.GREEN}Conversion: {conversion_name}{colors.RESET}")
-            print(f"{colors.BOLD}{colors.CYAN}{'=' * 50}{colors.RESET}")
+            rule = f"{colors.HEADER}{SEPARATOR}{colors.RESET}"
+            sys.stdout.write(f"\n{rule}\n{colors.SUCCESS}Conversion: {conversion_name}{colors.RESET}\n{rule}\n")
             
             try:
-                # Handle each conversion type explicitly to show steps
-                if option_num == 1:  # Decimal → Binary
-                    n = read_int("Enter decimal number: ")
-                    result, steps = dec_to_bin(n, show_steps=True)
-                elif option_num == 2:  # Binary → Decimal
-                    bstr = read_bin()
-                    result, steps = bin_to_dec(bstr, show_steps=True)
-                elif option_num == 3:  # Decimal → Octal
-                    n = read_int("Enter decimal number: ")
-                    result, steps = dec_to_oct(n, show_steps=True)
-                elif option_num == 4:  # Octal → Decimal
-                    ostr = read_oct()
-                    result, steps = oct_to_dec(ostr, show_steps=True)
-                elif option_num == 5:  # Decimal → Hexadecimal
-                    n = read_int("Enter decimal number: ")
-                    result, steps = dec_to_hex(n, show_steps=True)
-                elif option_num == 6:  # Hexadecimal → Decimal
-                    hstr = read_hex()
-                    result, steps = hex_to_dec(hstr, show_steps=True)
-                elif option_num == 7:  # Binary → Octal
-                    bstr = read_bin()
-                    result, steps = bin_to_oct(bstr, show_steps=True)
-                elif option_num == 8:  # Octal → Binary
-                    ostr = read_oct()
-                    result, steps = oct_to_bin(ostr, show_steps=True)
-                elif option_num == 9:  # Binary → Hexadecimal
-                    bstr = read_bin()
-                    result, steps = bin_to_hex(bstr, show_steps=True)
-                elif option_num == 10:  # Hexadecimal → Binary
-                    hstr = read_hex()
-                    result, steps = hex_to_bin(hstr, show_steps=True)
-                elif option_num == 11:  # Octal → Hexadecimal
-                    ostr = read_oct()
-                    result, steps = oct_to_hex(ostr, show_steps=True)
-                elif option_num == 12:  # Hexadecimal → Octal
-                    hstr = read_hex()
-                    result, steps = hex_to_oct(hstr, show_steps=True)
-                elif option_num == 13:  # Decimal → Any Base
-                    n = read_int("Enter decimal number: ")
-                    base = read_int("Enter target base (2-16): ")
-                    result, steps = dec_to_base(n, base, show_steps=True)
-                elif option_num == 14:  # Any Base → Decimal
-                    number_str = input("Enter number: ")
-                    base = read_int("Enter source base (2-16): ")
-                    result, steps = base_to_dec(number_str, base, show_steps=True)
-                elif option_num == 15:  # Decimal Float → Any Base
-                    decimal = float(input("Enter decimal float: "))
-                    base = read_int("Enter target base (2-16): ")
-                    result, steps = dec_to_base_float(decimal, base, show_steps=True)
-                elif option_num == 16:  # ASCII → Character
-                    code = read_int("Enter ASCII code: ")
-                    result, steps = ascii_to_char(code, show_steps=True)
-                elif option_num == 17:  # Character → ASCII
-                    char = input("Enter character: ")
-                    result, steps = char_to_ascii(char, show_steps=True)
-                elif option_num == 18:  # Number Base Detection
-                    number_str = input("Enter number: ")
-                    result = detect_base(number_str)
-                    steps = [f"Detected base for '{number_str}': {result}"]
-                elif option_num == 19:  # Toggle Color Scheme
-                    result = conversion_func()
-                    steps = [result]
-                else:
-                    # Fallback in case of unknown option
-                    result = conversion_func()
-                    steps = None
+                result, steps = converter(*MENU_READERS[option_num](), show_steps=True)
                 
-                # Display the result and steps with colors
-                print(f"\n{colors.BOLD}{colors.GREEN}Result: {colors.CYAN}{result}{colors.RESET}")
+                # Display the result and steps with colors, written out in one go
+                out = ["", f"{colors.SUCCESS}Result: {colors.CYAN}{result}{colors.RESET}"]
                 
                 if steps:
-                    print(f"\n{colors.BOLD}{colors.CYAN}{'=' * 50}{colors.RESET}")
-                    print(f"{colors.BOLD}{colors.YELLOW}Step-by-Step Conversion Process:{colors.RESET}")
-                    print(f"{colors.BOLD}{colors.CYAN}{'=' * 50}{colors.RESET}")
+                    # Rebuild the rule: option 19 may have just switched the colors
+                    rule = f"{colors.HEADER}{SEPARATOR}{colors.RESET}"
+                    out += ["", rule, f"{colors.OPTION}Step-by-Step Conversion Process:{colors.RESET}", rule]
                     for step in steps:
                         # Colorize different parts of the steps for better readability
-                        if any(keyword in step for keyword in ["Step", "Position", "Digit", "Value"]):
-                            print(f"{colors.BOLD}{colors.PURPLE}{step}{colors.RESET}")
-                        elif any(keyword in step.lower() for keyword in ["final", "result"]):
-                            print(f"{colors.BOLD}{colors.GREEN}{step}{colors.RESET}")
-                        elif any(keyword in step for keyword in ["-", "|"]):
-                            print(f"{colors.BOLD}{colors.BLUE}{step}{colors.RESET}")
+                        if STEP_LABEL_RE.search(step):
+                            out.append(f"{colors.BOLD}{colors.PURPLE}{step}{colors.RESET}")
+                        elif STEP_RESULT_RE.search(step):
+                            out.append(f"{colors.SUCCESS}{step}{colors.RESET}")
+                        elif STEP_RULE_RE.search(step):
+                            out.append(f"{colors.BOLD}{colors.BLUE}{step}{colors.RESET}")
                         else:
-                            print(step)
+                            out.append(step)
                 else:
-                    print("\nDetailed steps not available for this conversion.")
+                    out += ["", "Detailed steps not available for this conversion."]
+                
+                out.append("")
+                sys.stdout.write("\n".join(out))
                 
             except Exception as e:
-                # If there's an error, fall back to the original method
-                print(f"\n{colors.BOLD}{colors.RED}✗  Error: {e}{colors.RESET}")
-                print("\nUsing simplified conversion...")
-                result = conversion_func()
-                print(f"Result: {result}")
+                print(f"\n{colors.ERROR}✗  Error: {e}{colors.RESET}")
             
             # Ask user if they want to perform another conversion
             another = input("\nWould you like to perform another conversion? (y/n): ").lower().strip()
             if another != 'y':
                 print("\nThank you for using Advanced Number Base Converter. Good-bye!")
-                sys.exit(0)
+                return
                 
         except ValueError as e:
             print(f"✗  Error: {e}")